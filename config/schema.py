@@ -4,6 +4,7 @@ from strawberry.schema.config import StrawberryConfig
 from strawberry.tools import merge_types
 from strawberry_django.optimizer import DjangoOptimizerExtension
 
+from core.common.extensions import IntrospectionCacheExtension
 from core.users.mutations import UsersMutation
 from core.users.queries import UsersQuery
 
@@ -20,6 +21,6 @@ Mutation = merge_types("Mutation", (UsersMutation,))
 schema = JwtSchema(
     query=Query,
     mutation=Mutation,
-    extensions=[DjangoOptimizerExtension],
+    extensions=[DjangoOptimizerExtension, IntrospectionCacheExtension],
     config=StrawberryConfig(auto_camel_case=True),
 )
@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Optional
+
+from graphql import ExecutionResult, FieldNode, get_operation_ast, print_ast
+from strawberry import Schema
+from strawberry.extensions import SchemaExtension
+
+INTROSPECTION_CACHE_MAXSIZE = 32
+INTROSPECTION_FIELDS = frozenset({"__schema", "__typename"})
+
+IntrospectionCacheKey = tuple[Schema, str, Optional[str]]
+
+_introspection_results: OrderedDict[IntrospectionCacheKey, ExecutionResult] = OrderedDict()
+
+
+class IntrospectionCacheExtension(SchemaExtension):
+    """Serve repeated `__schema` introspection queries from a per-schema LRU cache."""
+
+    def on_execute(self) -> Iterator[None]:
+        key = self._cache_key()
+        if key is not None and key in _introspection_results:
+            _introspection_results.move_to_end(key)
+            self.execution_context.result = _introspection_results[key]
+
+        yield
+
+        if key is None or key in _introspection_results:
+            return
+
+        result = self.execution_context.result
+        if isinstance(result, ExecutionResult) and not result.errors:
+            _introspection_results[key] = result
+            if len(_introspection_results) > INTROSPECTION_CACHE_MAXSIZE:
+                _introspection_results.popitem(last=False)
+
+    def _cache_key(self) -> Optional[IntrospectionCacheKey]:
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        if document is None:
+            return None
+
+        operation = get_operation_ast(document, execution_context.operation_name)
+        if operation is None or operation.variable_definitions:
+            return None
+
+        # Only cache operations that actually introspect; `{ __typename }` alone is cheap.
+        selections = operation.selection_set.selections
+        names = [selection.name.value for selection in selections if isinstance(selection, FieldNode)]
+        if len(names) != len(selections) or not INTROSPECTION_FIELDS.issuperset(names) or "__schema" not in names:
+            return None
+
+        return execution_context.schema, print_ast(document), execution_context.operation_name
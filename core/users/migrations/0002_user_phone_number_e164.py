@@ -0,0 +1,67 @@
+# Generated by Django 5.2.6 on 2026-10-15 09:37
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
+
+# Digits that form a valid E.164 number once "+" is prepended.
+E164_DIGITS = r'^[1-9][0-9]{1,14}$'
+
+
+def add_plus_prefix(apps, schema_editor):
+    # The bigint column stored bare digits, so "+" is only added where the result is valid
+    # E.164. Anything else can't be converted without guessing a country code; it is cleared
+    # and reported so the numbers can be re-entered.
+    User = apps.get_model('users', 'User')
+    users = User.objects.using(schema_editor.connection.alias).filter(phone_number__isnull=False)
+
+    invalid = users.exclude(phone_number__regex=E164_DIGITS)
+    invalid_pks = list(invalid.values_list('pk', flat=True))
+    invalid.update(phone_number=None)
+
+    converted = users.update(phone_number=Concat(Value('+'), 'phone_number'))
+
+    if converted:
+        print(
+            f'\n  Prefixed "+" to {converted} phone number(s). This assumes the stored digits included a '
+            'country code; numbers saved without one now carry the wrong country and must be corrected by hand.'
+        )
+    if invalid_pks:
+        print(f'\n  Cleared {len(invalid_pks)} phone number(s) that are not valid E.164, for users: {invalid_pks}')
+
+
+def strip_plus_prefix(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    users = User.objects.using(schema_editor.connection.alias)
+
+    missing = users.filter(phone_number__isnull=True).count()
+    if missing:
+        raise ValueError(
+            f'Cannot reverse: {missing} user(s) have no phone number, and the previous column is NOT NULL. '
+            'Set their phone numbers or delete those users first.'
+        )
+
+    users.filter(phone_number__startswith='+').update(phone_number=Substr('phone_number', 2))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        # Wide enough for any bigint (19 digits) plus the "+", so the cast can't fail.
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(max_length=20, null=True, unique=True),
+        ),
+        migrations.RunPython(add_plus_prefix, strip_plus_prefix),
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(max_length=16, null=True, unique=True, validators=[django.core.validators.RegexValidator('^\\+[1-9]\\d{1,14}$', 'Enter a phone number in E.164 format.')]),
+        ),
+    ]
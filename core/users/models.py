@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser, PermissionsMixin
 from django.contrib.auth.models import BaseUserManager as BUM  # noqa: N817
+from django.core.validators import RegexValidator
 from django.db import models
 
 from core.common.models import BaseModel
@@ -44,7 +45,13 @@ class BaseUser(BaseModel):
 class User(BaseUser, AbstractUser, PermissionsMixin):
     username = None
     email = models.EmailField(blank=False, max_length=255, unique=True)
-    phone_number = models.PositiveBigIntegerField(unique=True)
+    # Nullable so accounts created without one (e.g. gqlauth registration) don't collide on "".
+    phone_number = models.CharField(
+        max_length=16,
+        unique=True,
+        null=True,
+        validators=[RegexValidator(r"^\+[1-9]\d{1,14}$", "Enter a phone number in E.164 format.")],
+    )
 
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
@@ -1,6 +1,8 @@
+import uuid
 from typing import Optional
 
 import strawberry
+from strawberry_django.optimizer import optimize
 
 from core.users.models import User
 from core.users.types import AppUserType
@@ -16,8 +18,6 @@ class UsersQuery:
         return None
 
     @strawberry.field(description="Get a user by primary key")
-    def user(self, id: int) -> Optional[AppUserType]:
-        try:
-            return User.objects.get(pk=id)
-        except User.DoesNotExist:
-            return None
+    async def user(self, info, id: uuid.UUID) -> Optional[AppUserType]:
+        # The optimizer narrows only() to the fields actually selected in the query.
+        return await optimize(User.objects.filter(pk=id), info).afirst()
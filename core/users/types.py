@@ -1,3 +1,5 @@
+import uuid
+
 import strawberry
 import strawberry_django
 
@@ -6,11 +8,12 @@ from core.users.models import User
 
 @strawberry_django.type(User, description="User account")
 class AppUserType:
-    id: strawberry.auto
+    # The child table's pk column, so selecting only `id` doesn't join users_baseuser.
+    id: uuid.UUID = strawberry_django.field(field_name="baseuser_ptr_id")
     email: strawberry.auto
     first_name: strawberry.auto
     last_name: strawberry.auto
     is_active: strawberry.auto
     is_staff: strawberry.auto
     is_superuser: strawberry.auto
-    phone_number: str
+    phone_number: strawberry.auto